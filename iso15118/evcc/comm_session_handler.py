@@ -552,6 +552,12 @@ class CommunicationSessionHandler:
                         logger.exception(exc)
                         # TODO not sure what else to do here
                 elif isinstance(notification, StopNotification):
+                    # Wait for the delayed teardown that stop() scheduled in
+                    # the background (charging disabled, TCP closed) before
+                    # breaking out of this loop or starting a new SDP cycle
+                    stop_task = self.comm_session[0]._stop_task
+                    if stop_task is not None:
+                        await stop_task
                     await cancel_task(self.comm_session[1])
                     del self.comm_session
                     if notification.successful:
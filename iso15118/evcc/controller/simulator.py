@@ -42,7 +42,6 @@ from iso15118.shared.messages.enums import (
     ControlMode,
     DCEVErrorCode,
     EnergyTransferModeEnum,
-    Namespace,
     PriceAlgorithm,
     Protocol,
     ServiceV20,
@@ -162,7 +161,7 @@ class SimEVController(EVControllerInterface):
                     "'000000000000'"
                 )
                 return "000000000000"
-        elif protocol.ns.startswith(Namespace.ISO_V20_BASE):
+        elif protocol.is_iso_v20:
             # The check digit (last character) is not a correctly computed one
             return "WMIV1234567890ABCDEX"
         else:
@@ -848,7 +848,7 @@ class SessionStop(StateEVCC):
         self.comm_session.stop_reason = StopNotification(
             True,
             "Communication session stopped successfully",
-            self.comm_session.writer.get_extra_info("peername"),
+            self.comm_session.peer_name,
         )
 
         self.next_state = Terminate
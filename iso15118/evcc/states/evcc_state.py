@@ -239,7 +239,7 @@ class StateEVCC(State, ABC):
                     to be terminated. Helpful for further debugging.
         """
         self.comm_session.stop_reason = StopNotification(
-            False, reason, self.comm_session.writer.get_extra_info("peername")
+            False, reason, self.comm_session.peer_name
         )
 
         self.next_state = Terminate
@@ -1150,7 +1150,7 @@ class SessionStop(StateEVCC):
         self.comm_session.stop_reason = StopNotification(
             True,
             f"Communication session " f"{session_stop_reason}d",
-            self.comm_session.writer.get_extra_info("peername"),
+            self.comm_session.peer_name,
             session_stop_action,
         )
 
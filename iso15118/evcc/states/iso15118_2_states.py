@@ -1075,7 +1075,7 @@ class SessionStop(StateEVCC):
             True,
             f"Communication session "
             f"{self.comm_session.charging_session_stop_v2.lower()}d",
-            self.comm_session.writer.get_extra_info("peername"),
+            self.comm_session.peer_name,
         )
 
         self.next_state = Terminate
@@ -14,7 +14,7 @@ import asyncio
 import logging
 import socket
 from asyncio.streams import StreamReader, StreamWriter
-from typing import Any, Coroutine, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple, Union
 
 from iso15118.secc.controller.ev_data import EVSessionContext15118
 from iso15118.secc.controller.interface import EVSEControllerInterface, ServiceStatus
@@ -161,7 +161,7 @@ class SECCCommunicationSession(V2GCommunicationSession):
         _, writer = transport
         return True if writer.get_extra_info("sslcontext") else False
 
-    async def stop(self, reason: str):
+    async def stop(self, reason: Union[str, Callable[[], str]]):
         await self.evse_controller.stop_charger()
         await super().stop(reason)
 
@@ -357,6 +357,12 @@ class CommunicationSessionHandler:
         self, peer_ip_address: Any, session_stop_action: SessionStopAction
     ):
         try:
+            # Wait for the delayed data link teardown that stop() scheduled in
+            # the background, so discovery is only resumed (and a new session
+            # accepted) once the old data link is terminated or paused
+            stop_task = self.comm_sessions[peer_ip_address[0]][0]._stop_task
+            if stop_task is not None:
+                await stop_task
             await cancel_task(self.tcp_server_handler)
             await cancel_task(self.comm_sessions[peer_ip_address[0]][1])
         except Exception as e:
@@ -97,7 +97,7 @@ class SessionSetup(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_dinspec(message, [SessionSetupReq])
+        msg = self.check_msg(message, V2GMessageDINSPEC, (SessionSetupReq,))
         if not msg:
             return
 
@@ -169,7 +169,7 @@ class ServiceDiscovery(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_dinspec(message, [ServiceDiscoveryReq])
+        msg = self.check_msg(message, V2GMessageDINSPEC, (ServiceDiscoveryReq,))
         if not msg:
             return
 
@@ -248,7 +248,7 @@ class ServicePaymentSelection(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_dinspec(message, [ServicePaymentSelectionReq])
+        msg = self.check_msg(message, V2GMessageDINSPEC, (ServicePaymentSelectionReq,))
         if not msg:
             return
 
@@ -310,7 +310,7 @@ class ContractAuthentication(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_dinspec(message, [ContractAuthenticationReq])
+        msg = self.check_msg(message, V2GMessageDINSPEC, (ContractAuthenticationReq,))
         if not msg:
             return
 
@@ -362,7 +362,7 @@ class ChargeParameterDiscovery(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_dinspec(message, [ChargeParameterDiscoveryReq])
+        msg = self.check_msg(message, V2GMessageDINSPEC, (ChargeParameterDiscoveryReq,))
         if not msg:
             return
 
@@ -451,7 +451,7 @@ class CableCheck(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_dinspec(message, [CableCheckReq])
+        msg = self.check_msg(message, V2GMessageDINSPEC, (CableCheckReq,))
         if not msg:
             return
 
@@ -550,8 +550,11 @@ class PreCharge(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_dinspec(
-            message, [PreChargeReq, PowerDeliveryReq], self.expecting_pre_charge_req
+        msg = self.check_msg(
+            message,
+            V2GMessageDINSPEC,
+            (PreChargeReq, PowerDeliveryReq),
+            self.expecting_pre_charge_req,
         )
         if not msg:
             return
@@ -671,13 +674,14 @@ class PowerDelivery(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_dinspec(
+        msg = self.check_msg(
             message,
-            [
+            V2GMessageDINSPEC,
+            (
                 PowerDeliveryReq,
                 SessionStopReq,
                 WeldingDetectionReq,
-            ],
+            ),
             self.expecting_power_delivery_req,
         )
         if not msg:
@@ -780,9 +784,10 @@ class CurrentDemand(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_dinspec(
+        msg = self.check_msg(
             message,
-            [CurrentDemandReq, PowerDeliveryReq],
+            V2GMessageDINSPEC,
+            (CurrentDemandReq, PowerDeliveryReq),
             self.expecting_current_demand_req,
         )
         if not msg:
@@ -874,9 +879,10 @@ class WeldingDetection(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_dinspec(
+        msg = self.check_msg(
             message,
-            [WeldingDetectionReq, SessionStopReq],
+            V2GMessageDINSPEC,
+            (WeldingDetectionReq, SessionStopReq),
             self.expect_welding_detection,
         )
         if not msg:
@@ -925,14 +931,14 @@ class SessionStop(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_dinspec(message, [SessionStopReq])
+        msg = self.check_msg(message, V2GMessageDINSPEC, (SessionStopReq,))
         if not msg:
             return
 
         self.comm_session.stop_reason = StopNotification(
             True,
             "Communication session stopped successfully",
-            self.comm_session.writer.get_extra_info("peername"),
+            self.comm_session.peer_name,
         )
 
         self.create_next_message(
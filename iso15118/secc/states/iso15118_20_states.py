@@ -140,7 +140,7 @@ class SessionSetup(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg: V2GMessageV20 = self.check_msg_v20(message, [SessionSetupReq])
+        msg: V2GMessageV20 = self.check_msg(message, V2GMessageV20, (SessionSetupReq,))
         if not msg:
             return
 
@@ -221,14 +221,15 @@ class AuthorizationSetup(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg: V2GMessageV20 = self.check_msg_v20(
+        msg: V2GMessageV20 = self.check_msg(
             message,
-            [
+            V2GMessageV20,
+            (
                 AuthorizationSetupReq,
                 AuthorizationReq,
                 CertificateInstallationReq,
                 SessionStopReq,
-            ],
+            ),
             self.expecting_auth_setup_req,
         )
         if not msg:
@@ -359,14 +360,15 @@ class Authorization(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg: V2GMessageV20 = self.check_msg_v20(
+        msg: V2GMessageV20 = self.check_msg(
             message,
-            [
+            V2GMessageV20,
+            (
                 AuthorizationReq,
                 CertificateInstallationReq,
                 ServiceDiscoveryReq,
                 SessionStopReq,
-            ],
+            ),
             self.expecting_authorization_req,
         )
         if not msg:
@@ -526,9 +528,10 @@ class ServiceDiscovery(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_v20(
+        msg = self.check_msg(
             message,
-            [ServiceDiscoveryReq, ServiceDetailReq, SessionStopReq],
+            V2GMessageV20,
+            (ServiceDiscoveryReq, ServiceDetailReq, SessionStopReq),
             self.expecting_service_discovery_req,
         )
         if not msg:
@@ -644,9 +647,10 @@ class ServiceDetail(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_v20(
+        msg = self.check_msg(
             message,
-            [ServiceDetailReq, ServiceSelectionReq, SessionStopReq],
+            V2GMessageV20,
+            (ServiceDetailReq, ServiceSelectionReq, SessionStopReq),
             # TODO Need to rethink this as we may also always expect a SessionStopReq,
             #      but not always a ServiceSelectionReq. The expect_first parameter
             #      doesn't work here as good as it does for ISO 15118-2
@@ -728,7 +732,9 @@ class ServiceSelection(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_v20(message, [ServiceSelectionReq, SessionStopReq], False)
+        msg = self.check_msg(
+            message, V2GMessageV20, (ServiceSelectionReq, SessionStopReq), False
+        )
         if not msg:
             return
 
@@ -905,9 +911,10 @@ class ScheduleExchange(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg: V2GMessageV20 = self.check_msg_v20(
+        msg: V2GMessageV20 = self.check_msg(
             message,
-            [ScheduleExchangeReq, DCCableCheckReq, PowerDeliveryReq, SessionStopReq],
+            V2GMessageV20,
+            (ScheduleExchangeReq, DCCableCheckReq, PowerDeliveryReq, SessionStopReq),
             False,
         )
         if not msg:
@@ -1023,8 +1030,11 @@ class PowerDelivery(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg: V2GMessageV20 = self.check_msg_v20(
-            message, [PowerDeliveryReq, DCWeldingDetectionReq, SessionStopReq], False
+        msg: V2GMessageV20 = self.check_msg(
+            message,
+            V2GMessageV20,
+            (PowerDeliveryReq, DCWeldingDetectionReq, SessionStopReq),
+            False,
         )
         if not msg:
             return
@@ -1235,7 +1245,9 @@ class SessionStop(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg: V2GMessageV20 = self.check_msg_v20(message, [SessionStopReq], False)
+        msg: V2GMessageV20 = self.check_msg(
+            message, V2GMessageV20, (SessionStopReq,), False
+        )
         if not msg:
             return
 
@@ -1271,7 +1283,7 @@ class SessionStop(StateSECC):
             True,
             f"Communication session {session_stop_state.value}d. "
             f"EV Info: {termination_info}",
-            self.comm_session.writer.get_extra_info("peername"),
+            self.comm_session.peer_name,
             session_stop_state,
         )
 
@@ -1316,8 +1328,11 @@ class ACChargeParameterDiscovery(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg: V2GMessageV20 = self.check_msg_v20(
-            message, [ACChargeParameterDiscoveryReq, SessionStopReq], False
+        msg: V2GMessageV20 = self.check_msg(
+            message,
+            V2GMessageV20,
+            (ACChargeParameterDiscoveryReq, SessionStopReq),
+            False,
         )
         if not msg:
             return
@@ -1396,11 +1411,12 @@ class ACChargeLoop(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg: V2GMessageV20 = self.check_msg_v20(
+        msg: V2GMessageV20 = self.check_msg(
             # TODO A MeteringConfirmationReq can come in using the multiplexed side
             #      stream. Need to figure out how to enable multiplexed communication
             message,
-            [ACChargeLoopReq, PowerDeliveryReq, SessionStopReq],
+            V2GMessageV20,
+            (ACChargeLoopReq, PowerDeliveryReq, SessionStopReq),
             False,
         )
         if not msg:
@@ -1512,8 +1528,11 @@ class DCChargeParameterDiscovery(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg: V2GMessageV20 = self.check_msg_v20(
-            message, [DCChargeParameterDiscoveryReq, SessionStopReq], False
+        msg: V2GMessageV20 = self.check_msg(
+            message,
+            V2GMessageV20,
+            (DCChargeParameterDiscoveryReq, SessionStopReq),
+            False,
         )
         if not msg:
             return
@@ -1596,8 +1615,8 @@ class DCCableCheck(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg: V2GMessageV20 = self.check_msg_v20(
-            message, [DCCableCheckReq, SessionStopReq], False
+        msg: V2GMessageV20 = self.check_msg(
+            message, V2GMessageV20, (DCCableCheckReq, SessionStopReq), False
         )
         if not msg:
             return
@@ -1681,9 +1700,10 @@ class DCPreCharge(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg: V2GMessageV20 = self.check_msg_v20(
+        msg: V2GMessageV20 = self.check_msg(
             message,
-            [DCPreChargeReq, PowerDeliveryReq],
+            V2GMessageV20,
+            (DCPreChargeReq, PowerDeliveryReq),
             self.expecting_precharge_req,
         )
         if not msg:
@@ -1754,8 +1774,11 @@ class DCChargeLoop(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg: V2GMessageV20 = self.check_msg_v20(
-            message, [DCChargeLoopReq, PowerDeliveryReq], self.expecting_charge_loop_req
+        msg: V2GMessageV20 = self.check_msg(
+            message,
+            V2GMessageV20,
+            (DCChargeLoopReq, PowerDeliveryReq),
+            self.expecting_charge_loop_req,
         )
         if not msg:
             return
@@ -1898,9 +1921,10 @@ class DCWeldingDetection(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg: V2GMessageV20 = self.check_msg_v20(
+        msg: V2GMessageV20 = self.check_msg(
             message,
-            [DCWeldingDetectionReq, SessionStopReq],
+            V2GMessageV20,
+            (DCWeldingDetectionReq, SessionStopReq),
             self.expecting_welding_detection_req,
         )
         if not msg:
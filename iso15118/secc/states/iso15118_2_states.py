@@ -172,7 +172,7 @@ class SessionSetup(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_v2(message, [SessionSetupReq])
+        msg = self.check_msg(message, V2GMessageV2, (SessionSetupReq,))
         if not msg:
             return
 
@@ -261,9 +261,10 @@ class ServiceDiscovery(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_v2(
+        msg = self.check_msg(
             message,
-            [ServiceDiscoveryReq, ServiceDetailReq, PaymentServiceSelectionReq],
+            V2GMessageV2,
+            (ServiceDiscoveryReq, ServiceDetailReq, PaymentServiceSelectionReq),
             self.expecting_service_discovery_req,
         )
         if not msg:
@@ -435,9 +436,10 @@ class ServiceDetail(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_v2(
+        msg = self.check_msg(
             message,
-            [ServiceDetailReq, PaymentServiceSelectionReq],
+            V2GMessageV2,
+            (ServiceDetailReq, PaymentServiceSelectionReq),
             self.expecting_service_detail_req,
         )
         if not msg:
@@ -547,14 +549,15 @@ class PaymentServiceSelection(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_v2(
+        msg = self.check_msg(
             message,
-            [
+            V2GMessageV2,
+            (
                 PaymentServiceSelectionReq,
                 CertificateInstallationReq,
                 PaymentDetailsReq,
                 AuthorizationReq,
-            ],
+            ),
             self.expecting_service_selection_req,
         )
         if not msg:
@@ -671,7 +674,7 @@ class CertificateInstallation(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_v2(message, [CertificateInstallationReq])
+        msg = self.check_msg(message, V2GMessageV2, (CertificateInstallationReq,))
         if not msg:
             return
 
@@ -934,7 +937,7 @@ class PaymentDetails(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_v2(message, [PaymentDetailsReq])
+        msg = self.check_msg(message, V2GMessageV2, (PaymentDetailsReq,))
         if not msg:
             return
 
@@ -1131,7 +1134,7 @@ class Authorization(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_v2(message, [AuthorizationReq])
+        msg = self.check_msg(message, V2GMessageV2, (AuthorizationReq,))
 
         if not msg:
             return
@@ -1316,9 +1319,10 @@ class ChargeParameterDiscovery(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_v2(
+        msg = self.check_msg(
             message,
-            [ChargeParameterDiscoveryReq, PowerDeliveryReq, CableCheckReq],
+            V2GMessageV2,
+            (ChargeParameterDiscoveryReq, PowerDeliveryReq, CableCheckReq),
             self.expecting_charge_parameter_discovery_req,
         )
         if not msg:
@@ -1591,13 +1595,14 @@ class PowerDelivery(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_v2(
+        msg = self.check_msg(
             message,
-            [
+            V2GMessageV2,
+            (
                 PowerDeliveryReq,
                 SessionStopReq,
                 WeldingDetectionReq,
-            ],
+            ),
             self.expecting_power_delivery_req,
         )
         if not msg:
@@ -1933,9 +1938,10 @@ class MeteringReceipt(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_v2(
+        msg = self.check_msg(
             message,
-            [MeteringReceiptReq, ChargingStatusReq, CurrentDemandReq, PowerDeliveryReq],
+            V2GMessageV2,
+            (MeteringReceiptReq, ChargingStatusReq, CurrentDemandReq, PowerDeliveryReq),
             self.expecting_metering_receipt_req,
         )
         if not msg:
@@ -2037,7 +2043,7 @@ class SessionStop(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_v2(message, [SessionStopReq])
+        msg = self.check_msg(message, V2GMessageV2, (SessionStopReq,))
         if not msg:
             return
         next_state: Type[State] = None
@@ -2054,7 +2060,7 @@ class SessionStop(StateSECC):
         self.comm_session.stop_reason = StopNotification(
             True,
             f"EV requested to {session_stop_state.value} the communication session",
-            self.comm_session.writer.get_extra_info("peername"),
+            self.comm_session.peer_name,
             session_stop_state,
         )
         self.create_next_message(
@@ -2109,9 +2115,10 @@ class ChargingStatus(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_v2(
+        msg = self.check_msg(
             message,
-            [ChargingStatusReq, PowerDeliveryReq, MeteringReceiptReq],
+            V2GMessageV2,
+            (ChargingStatusReq, PowerDeliveryReq, MeteringReceiptReq),
             self.expecting_charging_status_req,
         )
         if not msg:
@@ -2198,7 +2205,7 @@ class CableCheck(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_v2(message, [CableCheckReq])
+        msg = self.check_msg(message, V2GMessageV2, (CableCheckReq,))
         if not msg:
             return
 
@@ -2299,9 +2306,10 @@ class PreCharge(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_v2(
+        msg = self.check_msg(
             message,
-            [PreChargeReq, PowerDeliveryReq],
+            V2GMessageV2,
+            (PreChargeReq, PowerDeliveryReq),
             self.expecting_precharge_req,
         )
         if not msg:
@@ -2413,9 +2421,10 @@ class CurrentDemand(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_v2(
+        msg = self.check_msg(
             message,
-            [CurrentDemandReq, PowerDeliveryReq],
+            V2GMessageV2,
+            (CurrentDemandReq, PowerDeliveryReq),
             self.expecting_current_demand_req,
         )
         if not msg:
@@ -2526,12 +2535,13 @@ class WeldingDetection(StateSECC):
         ],
         message_exi: bytes = None,
     ):
-        msg = self.check_msg_v2(
+        msg = self.check_msg(
             message,
-            [
+            V2GMessageV2,
+            (
                 WeldingDetectionReq,
                 SessionStopReq,
-            ],
+            ),
             self.expecting_welding_detection_req,
         )
         if not msg:
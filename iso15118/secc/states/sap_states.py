@@ -52,7 +52,7 @@ class SupportedAppProtocol(StateSECC):
         message_exi: bytes = None,
     ):
         msg = self.check_msg(
-            message, SupportedAppProtocolReq, [SupportedAppProtocolReq]
+            message, SupportedAppProtocolReq, (SupportedAppProtocolReq,)
         )
         if not msg:
             return
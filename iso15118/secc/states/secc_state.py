@@ -5,7 +5,16 @@ which extends the state shared between the EVCC and SECC.
 
 import logging
 from abc import ABC
-from typing import List, Optional, Type, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from iso15118.secc.comm_session_handler import SECCCommunicationSession
 from iso15118.shared.messages.app_protocol import (
@@ -14,40 +23,69 @@ from iso15118.shared.messages.app_protocol import (
     SupportedAppProtocolRes,
 )
 from iso15118.shared.messages.din_spec.body import BodyBase as BodyBaseDINSPEC
-from iso15118.shared.messages.din_spec.body import (
-    SessionSetupReq as SessionSetupReqDINSPEC,
-)
-from iso15118.shared.messages.din_spec.body import get_msg_type as get_msg_type_dinspec
 from iso15118.shared.messages.din_spec.datatypes import (
     ResponseCode as ResponseCodeDINSPEC,
 )
 from iso15118.shared.messages.din_spec.msgdef import V2GMessage as V2GMessageDINSPEC
 from iso15118.shared.messages.enums import Namespace
 from iso15118.shared.messages.iso15118_2.body import BodyBase as BodyBaseV2
-from iso15118.shared.messages.iso15118_2.body import (
-    SessionSetupReq as SessionSetupReqV2,
-)
-from iso15118.shared.messages.iso15118_2.body import get_msg_type
 from iso15118.shared.messages.iso15118_2.datatypes import ResponseCode as ResponseCodeV2
 from iso15118.shared.messages.iso15118_2.msgdef import V2GMessage as V2GMessageV2
-from iso15118.shared.messages.iso15118_20.common_messages import (
-    SessionSetupReq as SessionSetupReqV20,
-)
-from iso15118.shared.messages.iso15118_20.common_types import (
-    ResponseCode as ResponseCodeV20,
-)
-from iso15118.shared.messages.iso15118_20.common_types import V2GMessage
-from iso15118.shared.messages.iso15118_20.common_types import (
-    V2GMessage as V2GMessageV20,
-)
-from iso15118.shared.messages.iso15118_20.common_types import (
-    V2GRequest as V2GRequestV20,
-)
 from iso15118.shared.notifications import StopNotification
 from iso15118.shared.states import State, Terminate
 
+if TYPE_CHECKING:
+    # The ISO 15118-20 message modules are only imported for type hints here;
+    # at runtime they are imported lazily inside stop_state_machine(), so that
+    # SECCs serving only DIN SPEC and -2 sessions don't pay the import cost of
+    # the -20 pydantic models
+    from iso15118.shared.messages.iso15118_20.common_types import (
+        ResponseCode as ResponseCodeV20,
+    )
+    from iso15118.shared.messages.iso15118_20.common_types import V2GMessage
+    from iso15118.shared.messages.iso15118_20.common_types import (
+        V2GMessage as V2GMessageV20,
+    )
+    from iso15118.shared.messages.iso15118_20.common_types import (
+        V2GRequest as V2GRequestV20,
+    )
+
 logger = logging.getLogger(__name__)
 
+# Memoises isinstance results per concrete message type. The set of V2G
+# message types exchanged during a session is small, fixed and not dynamically
+# registered, so this cache stays tiny while reducing the isinstance checks
+# executed on every state transition to a single dict lookup each.
+_isinstance_cache: Dict[Tuple[type, object], bool] = {}
+
+# Maps each (message body type, expected message types, expect_first)
+# combination to whether the message is accepted. Filled lazily by check_msg;
+# the number of distinct combinations is bounded by the state machine itself,
+# so the table stays small.
+_transition_table: Dict[Tuple[type, Tuple[type, ...], bool], bool] = {}
+
+# Maps the concrete type of a faulty request to the corresponding protocol
+# namespace, so stop_state_machine can resolve the common cases with a single
+# dict lookup instead of walking an isinstance chain. ISO 15118-20 messages
+# are not listed here, as each request is its own V2GMessage subclass.
+_faulty_request_namespaces: Dict[type, Namespace] = {
+    V2GMessageV2: Namespace.ISO_V2_MSG_DEF,
+    V2GMessageDINSPEC: Namespace.DIN_MSG_DEF,
+    SupportedAppProtocolReq: Namespace.SAP,
+}
+
+
+_T = TypeVar("_T")
+
+
+def _cached_isinstance(obj, class_or_tuple) -> bool:
+    key = (type(obj), class_or_tuple)
+    result = _isinstance_cache.get(key)
+    if result is None:
+        result = isinstance(obj, class_or_tuple)
+        _isinstance_cache[key] = result
+    return result
+
 
 class StateSECC(State, ABC):
     """
@@ -65,12 +103,7 @@ class StateSECC(State, ABC):
     2.b If step 2 returns False, terminate the session with stop_secc()
     """
 
-    # The response code can be set by various methods on which a State's
-    # process_message() method might rely on, such as is_message_valid().
-    # The default response code 'OK' can be overwritten as needed.
-    response_code: Union[
-        ResponseCodeDINSPEC, ResponseCodeV2, ResponseCodeV20
-    ] = ResponseCodeV2.OK
+    __slots__ = ("response_code",)
 
     def __init__(
         self, comm_session: "SECCCommunicationSession", timeout: Union[float, int] = 0
@@ -93,73 +126,12 @@ class StateSECC(State, ABC):
         """
         super().__init__(comm_session, timeout)
         self.comm_session: "SECCCommunicationSession" = comm_session
-
-    T = TypeVar("T")
-
-    def check_msg_dinspec(
-        self,
-        message: Union[
-            SupportedAppProtocolReq,
-            SupportedAppProtocolRes,
-            V2GMessageV2,
-            V2GMessageV20,
-            V2GMessageDINSPEC,
-        ],
-        expected_msg_types: List[
-            Union[
-                Type[SupportedAppProtocolReq],
-                Type[BodyBaseDINSPEC],
-                Type[V2GRequestV20],
-                Type[BodyBaseV2],
-            ]
-        ],
-        expect_first: bool = True,
-    ) -> V2GMessageDINSPEC:
-        return self.check_msg(
-            message, V2GMessageDINSPEC, expected_msg_types, expect_first
-        )
-
-    def check_msg_v2(
-        self,
-        message: Union[
-            SupportedAppProtocolReq,
-            SupportedAppProtocolRes,
-            V2GMessageV2,
-            V2GMessageV20,
-            V2GMessageDINSPEC,
-        ],
-        expected_msg_types: List[
-            Union[
-                Type[SupportedAppProtocolReq],
-                Type[BodyBaseV2],
-                Type[V2GRequestV20],
-                Type[BodyBaseDINSPEC],
-            ]
-        ],
-        expect_first: bool = True,
-    ) -> V2GMessageV2:
-        return self.check_msg(message, V2GMessageV2, expected_msg_types, expect_first)
-
-    def check_msg_v20(
-        self,
-        message: Union[
-            SupportedAppProtocolReq,
-            SupportedAppProtocolRes,
-            V2GMessageV2,
-            V2GMessageV20,
-            V2GMessageDINSPEC,
-        ],
-        expected_msg_types: List[
-            Union[
-                Type[SupportedAppProtocolReq],
-                Type[BodyBaseV2],
-                Type[V2GRequestV20],
-                Type[BodyBaseDINSPEC],
-            ]
-        ],
-        expect_first: bool = True,
-    ) -> V2GMessageV20:
-        return self.check_msg(message, V2GMessageV20, expected_msg_types, expect_first)
+        # The response code can be set by various methods on which a State's
+        # process_message() method might rely on, such as is_message_valid().
+        # The default response code 'OK' can be overwritten as needed.
+        self.response_code: Union[
+            ResponseCodeDINSPEC, ResponseCodeV2, "ResponseCodeV20"
+        ] = ResponseCodeV2.OK
 
     def check_msg(
         self,
@@ -167,20 +139,21 @@ class StateSECC(State, ABC):
             SupportedAppProtocolReq,
             SupportedAppProtocolRes,
             V2GMessageV2,
-            V2GMessageV20,
+            "V2GMessageV20",
             V2GMessageDINSPEC,
         ],
-        expected_return_type: Type[T],
-        expected_msg_types: List[
+        expected_return_type: Type[_T],
+        expected_msg_types: Tuple[
             Union[
                 Type[SupportedAppProtocolReq],
                 Type[BodyBaseV2],
-                Type[V2GRequestV20],
+                Type["V2GRequestV20"],
                 Type[BodyBaseDINSPEC],
-            ]
+            ],
+            ...,
         ],
         expect_first: bool = True,
-    ) -> Optional[T]:
+    ) -> Optional[_T]:
         """
         This function is used to reduce code redundancy in the process_message()
         method of each SECC state. The following checks are covered:
@@ -200,7 +173,7 @@ class StateSECC(State, ABC):
             expected_msg_types: The expected request message type, in particular the
                                 message body
             expect_first: Whether or not only the first message type provided
-                          with the list expected_msg_types is allowed.
+                          with the tuple expected_msg_types is allowed.
 
                           Example:
                           While in the state PaymentServiceSelection, we can expect a
@@ -223,9 +196,10 @@ class StateSECC(State, ABC):
         """
         # TODO: Check the need for this if clause also because the Response code is
         # specific for V2 and we now have DIN and V20....
-        if not isinstance(message, expected_return_type):
+        if not _cached_isinstance(message, expected_return_type):
             self.stop_state_machine(
-                f"{type(message)}' not a valid message type " f"in state {str(self)}",
+                lambda: f"{type(message)}' not a valid message type "
+                f"in state {str(self)}",
                 message,
                 ResponseCodeV2.FAILED_SEQUENCE_ERROR,
             )
@@ -234,49 +208,48 @@ class StateSECC(State, ABC):
         msg_body: Union[
             SupportedAppProtocolReq, BodyBaseV2, V2GRequestV20, BodyBaseDINSPEC
         ]
-        if isinstance(message, V2GMessageV2) or isinstance(message, V2GMessageDINSPEC):
-            # ISO 15118-2
-            msg_body = message.body.get_message()  # type: ignore
+        # Only ISO 15118-2 and DIN SPEC messages wrap the actual message in a
+        # Body element; SAP and ISO 15118-20 messages are the body themselves.
+        # Probing for the body attribute dispatches on that structural
+        # difference directly, without any type checks
+        body = getattr(message, "body", None)
+        if body is not None:
+            msg_body = body.get_message()
         else:
             # SupportedAppProtocolReq, V2GRequestV20 (ISO 15118-20)
             msg_body = message
 
-        match = False
-        for idx, expected_msg_type in enumerate(expected_msg_types):
-            if (
-                idx == 0
-                and expect_first
-                and not isinstance(msg_body, expected_msg_type)
-            ):
-                self.stop_state_machine(
-                    f"{str(message)}' not accepted in state " f"{str(self)}",
-                    message,
-                    ResponseCodeV2.FAILED_SEQUENCE_ERROR,
-                )
-                return None
-
-            if isinstance(msg_body, expected_msg_type):
-                match = True
-                break
-
-        if not match:
+        # The state machine's transition table: whether a message type is
+        # accepted for a given set of expected types is cached after the first
+        # traversal, so subsequent dispatches are a single dict lookup
+        transition = (type(msg_body), expected_msg_types, expect_first)
+        accepted = _transition_table.get(transition)
+        if accepted is None:
+            if expect_first:
+                # When first entering the state, only the first of the expected
+                # message types is allowed
+                accepted = isinstance(msg_body, expected_msg_types[:1])
+            else:
+                accepted = isinstance(msg_body, expected_msg_types)
+            _transition_table[transition] = accepted
+        if not accepted:
             self.stop_state_machine(
-                f"{str(message)}' not accepted in state " f"{str(self)}",
+                lambda: f"{str(message)}' not accepted in state " f"{str(self)}",
                 message,
                 ResponseCodeV2.FAILED_SEQUENCE_ERROR,
             )
             return None
 
+        # Messages that may arrive before a session ID has been agreed upon
+        # (SupportedAppProtocolReq and the SessionSetupReqs) carry a truthy
+        # _skip_session_check class attribute, which replaces the isinstance
+        # checks previously run on every single message
         if (
-            not isinstance(
-                msg_body,
-                (SessionSetupReqV2, SessionSetupReqV20, SessionSetupReqDINSPEC),
-            )
-            and not isinstance(message, SupportedAppProtocolReq)
+            not getattr(msg_body, "_skip_session_check", False)
             and not message.header.session_id == self.comm_session.session_id
         ):
             self.stop_state_machine(
-                f"{str(message)}'s session ID "
+                lambda: f"{str(message)}'s session ID "
                 f"{message.header.session_id} does not match "
                 f"session ID {self.comm_session.session_id}",
                 message,
@@ -288,17 +261,17 @@ class StateSECC(State, ABC):
 
     def stop_state_machine(
         self,
-        reason: str,
+        reason: Union[str, Callable[[], str]],
         faulty_request: Union[
             SupportedAppProtocolReq,
             SupportedAppProtocolRes,
             V2GMessageV2,
-            V2GMessageV20,
+            "V2GMessageV20",
             V2GMessageDINSPEC,
             None,
         ],
         response_code: Union[
-            ResponseCodeSAP, ResponseCodeV2, ResponseCodeV20, ResponseCodeDINSPEC
+            ResponseCodeSAP, ResponseCodeV2, "ResponseCodeV20", ResponseCodeDINSPEC
         ],
         message_body_type: Optional[type] = None,
         namespace: Optional[Namespace] = None,
@@ -314,9 +287,20 @@ class StateSECC(State, ABC):
         corresponding to the incoming request. The SECC always needs to respond to the
         incoming request, even if the request was coming in the wrong order, causing a
         FAILED_SequenceError.
+
+        The reason can also be provided as a zero-argument callable returning
+        the reason string, so that callers can defer the (potentially
+        expensive) formatting of the message until the session is actually
+        being stopped.
         """
+        from iso15118.shared.messages.iso15118_20.common_types import (
+            V2GMessage as V2GMessageV20,
+        )
+
+        # A callable reason is handed to the StopNotification unevaluated;
+        # its lazy 'reason' property formats the string on first read
         self.comm_session.stop_reason = StopNotification(
-            False, reason, self.comm_session.writer.get_extra_info("peername")
+            False, reason, self.comm_session.peer_name
         )
         msg_type: Optional[
             Union[
@@ -324,29 +308,37 @@ class StateSECC(State, ABC):
                 SupportedAppProtocolReq,
             ]
         ] = None
-        if isinstance(faulty_request, V2GMessageV2):
-            msg_type = get_msg_type(str(faulty_request))
-            msg_namespace = Namespace.ISO_V2_MSG_DEF
-        elif isinstance(faulty_request, V2GMessageDINSPEC):
-            msg_type = get_msg_type_dinspec(str(faulty_request))
-            msg_namespace = Namespace.DIN_MSG_DEF
-        elif isinstance(faulty_request, V2GMessageV20):
-            msg_type = type(faulty_request)
-            msg_namespace = Namespace.ISO_V20_BASE
-        elif isinstance(faulty_request, SupportedAppProtocolReq):
+        request_type = type(faulty_request)
+        msg_namespace = _faulty_request_namespaces.get(request_type)
+        # Enum members are singletons, so comparing them by identity avoids
+        # the str.__eq__ dispatch of the str-mixed Namespace enum. The response
+        # code enums themselves have to stay str-based, as their values are
+        # serialised verbatim into the EXI stream.
+        if (
+            msg_namespace is Namespace.ISO_V2_MSG_DEF
+            or msg_namespace is Namespace.DIN_MSG_DEF
+        ):
+            msg_type = type(faulty_request.body.get_message())
+        elif msg_namespace is Namespace.SAP:
             msg_type = faulty_request
-            msg_namespace = Namespace.SAP
+        elif _cached_isinstance(faulty_request, V2GMessageV20):
+            msg_type = request_type
+            msg_namespace = Namespace.ISO_V20_BASE
         else:
             msg_type = message_body_type
             msg_namespace = namespace
 
-        if msg_namespace == Namespace.ISO_V2_MSG_DEF:
+        # The failed_responses_* dicts hold shared response templates, one per
+        # session. copy(update=...) produces a fresh message with the negative
+        # response code set, without mutating the template and without going
+        # through pydantic's assignment validation.
+        if msg_namespace is Namespace.ISO_V2_MSG_DEF:
             error_res = self.comm_session.failed_responses_isov2.get(msg_type)
-            error_res.response_code = response_code
+            error_res = error_res.copy(update={"response_code": response_code})
             self.create_next_message(Terminate, error_res, 0, Namespace.ISO_V2_MSG_DEF)
-        elif msg_namespace == Namespace.DIN_MSG_DEF:
+        elif msg_namespace is Namespace.DIN_MSG_DEF:
             error_res = self.comm_session.failed_responses_din_spec.get(msg_type)
-            error_res.response_code = response_code
+            error_res = error_res.copy(update={"response_code": response_code})
             self.create_next_message(Terminate, error_res, 0, Namespace.DIN_MSG_DEF)
         # Here we could have been more specific and check if it is a V2GRequestV20,
         # but to be consistent with the other if clauses and since there is no negative
@@ -359,15 +351,24 @@ class StateSECC(State, ABC):
             ) = self.comm_session.failed_responses_isov20.get(msg_type)
             # As the Header in the case of -20 is part of the -20 message payload,
             # we need to set the session id of the current session to it
-            error_res.header.session_id = self.comm_session.session_id
-            error_res.response_code = response_code
+            error_res = error_res.copy(
+                update={
+                    "header": error_res.header.copy(
+                        update={"session_id": self.comm_session.session_id}
+                    ),
+                    "response_code": response_code,
+                }
+            )
             self.create_next_message(Terminate, error_res, 0, namespace, payload_type)
-        elif msg_namespace == Namespace.SAP:
+        elif msg_namespace is Namespace.SAP:
             error_res = SupportedAppProtocolRes(response_code=response_code)
             self.create_next_message(Terminate, error_res, 0, Namespace.SAP)
         else:
-            # Should actually never happen
-            logger.error(
-                "Something's off here: the faulty_request and response_code "
-                "are not of the expected type"
-            )
+            # Should actually never happen, now that the dispatch above is a
+            # dict lookup; gate the logging call anyway so a disabled logger
+            # makes this branch free
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(
+                    "Something's off here: the faulty_request and response_code "
+                    "are not of the expected type"
+                )
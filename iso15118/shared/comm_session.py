@@ -8,9 +8,10 @@ receiving, and processing messages during an ISO 15118 communication session.
 import asyncio
 import gc
 import logging
+import socket
 from abc import ABC, abstractmethod
 from asyncio.streams import StreamReader, StreamWriter
-from typing import List, Optional, Tuple, Type, Union
+from typing import Callable, List, Optional, Tuple, Type, Union
 
 from pydantic import ValidationError
 from typing_extensions import TYPE_CHECKING
@@ -23,6 +24,7 @@ from iso15118.shared.exceptions import (
     V2GMessageValidationError,
 )
 from iso15118.shared.exi_codec import EXI
+from iso15118.shared.logging import TRACE_LEVEL
 from iso15118.shared.messages.app_protocol import (
     SupportedAppProtocolReq,
     SupportedAppProtocolRes,
@@ -57,6 +59,34 @@ from iso15118.shared.utils import wait_for_tasks
 
 logger = logging.getLogger(__name__)
 
+# asyncio.timeout (Python 3.11+) enforces a deadline with a single timer
+# handle, whereas asyncio.wait_for wraps the awaitable in an extra Task per
+# call. Use the cheaper variant where the runtime provides it; this package
+# still supports Python 3.9.
+_asyncio_timeout = getattr(asyncio, "timeout", None)
+
+# The maximum V2GTP payload length accepted from the TCP socket. The biggest
+# message is the Certificate Installation Response, which is estimated to be
+# maximum between 5k to 6k
+# TODO check if that still holds with -20 (e.g. cross certs)
+_MAX_READ_SIZE = 7000
+
+# Maps the protocols whose messages all live in a single XSD namespace to that
+# namespace. ISO 15118-20 protocols are not listed, as their namespace depends
+# on the payload type of the individual message.
+_protocol_namespaces = {
+    Protocol.UNKNOWN: Namespace.SAP,
+    Protocol.ISO_15118_2: Namespace.ISO_V2_MSG_DEF,
+    Protocol.DIN_SPEC_70121: Namespace.DIN_MSG_DEF,
+}
+
+_v20_payload_type_to_namespace = {
+    ISOV20PayloadTypes.AC_MAINSTREAM: Namespace.ISO_V20_AC,
+    ISOV20PayloadTypes.DC_MAINSTREAM: Namespace.ISO_V20_DC,
+    ISOV20PayloadTypes.ACDP_MAINSTREAM: Namespace.ISO_V20_ACDP,
+    ISOV20PayloadTypes.WPT_MAINSTREAM: Namespace.ISO_V20_WPT,
+}
+
 if TYPE_CHECKING:
     # EVCCCommunicationSession and SECCCommunicationSession are used for
     # annotation purposes only, as a type hint for the comm_session class
@@ -110,12 +140,10 @@ class SessionStateMachine(ABC):
         self.start_state = start_state
         self.comm_session = comm_session
         self.current_state = start_state(comm_session)
-        self.v20_payload_type_to_namespace = {
-            ISOV20PayloadTypes.AC_MAINSTREAM: Namespace.ISO_V20_AC,
-            ISOV20PayloadTypes.DC_MAINSTREAM: Namespace.ISO_V20_DC,
-            ISOV20PayloadTypes.ACDP_MAINSTREAM: Namespace.ISO_V20_ACDP,
-            ISOV20PayloadTypes.WPT_MAINSTREAM: Namespace.ISO_V20_WPT,
-        }
+        # The bound from_exi method of the EXI codec singleton, resolved once
+        # per session so process_message() doesn't have to go through the
+        # singleton's __new__ for every incoming message
+        self._from_exi = EXI().from_exi
 
     def get_exi_ns(
         self,
@@ -133,20 +161,16 @@ class SessionStateMachine(ABC):
         energy mode specific and, thus, we need the specific schema where these
         messages are defined.
         """
-        if self.comm_session.protocol == Protocol.UNKNOWN:
-            return Namespace.SAP
-        elif self.comm_session.protocol == Protocol.ISO_15118_2:
-            return Namespace.ISO_V2_MSG_DEF
-        elif self.comm_session.protocol == Protocol.DIN_SPEC_70121:
-            return Namespace.DIN_MSG_DEF
-        elif self.comm_session.protocol.ns.startswith(Namespace.ISO_V20_BASE):
-            if isinstance(payload_type, ISOV20PayloadTypes):
-                return self.v20_payload_type_to_namespace.get(
-                    payload_type, Namespace.ISO_V20_COMMON_MSG
-                )
-        return Namespace.ISO_V20_COMMON_MSG
+        namespace = _protocol_namespaces.get(self.comm_session.protocol)
+        if namespace is not None:
+            return namespace
+        # Any other protocol is an ISO 15118-20 variant, where the namespace
+        # is determined by the payload type of the message
+        return _v20_payload_type_to_namespace.get(
+            payload_type, Namespace.ISO_V20_COMMON_MSG
+        )
 
-    async def process_message(self, message: bytes):
+    async def process_message(self, header: bytes, payload: bytes):
         """
         The following steps are conducted in this state machine's general
         process_message() function:
@@ -166,9 +190,10 @@ class SessionStateMachine(ABC):
            process_message() method.
 
         Args:
-            message:    The incoming message from the EVCC/SECC, given as a
-                        bytearray (the payload of a V2GTPMessage).
-                        The message can be a
+            header:     The 8-byte V2GTP header of the incoming message, as
+                        read from the TCP socket
+            payload:    The V2GTP payload of the incoming message, which can
+                        be a
                         - SupportedAppProtocolRequest  (EVCC),
                         - SupportedAppProtocolResponse (SECC),
                         - V2GMessage according to the DIN SPEC 70121 standard,
@@ -181,9 +206,11 @@ class SessionStateMachine(ABC):
         """
         # Step 1
         try:
-            # First extract the V2GMessage payload from the V2GTPMessage ...
-            # and then decode the bytearray into the message
-            v2gtp_msg = V2GTPMessage.from_bytes(self.comm_session.protocol, message)
+            # First validate the V2GTP header of the incoming message ...
+            # and then decode the payload into the message
+            v2gtp_msg = V2GTPMessage.from_parts(
+                self.comm_session.protocol, header, payload
+            )
         except InvalidV2GTPMessageError as exc:
             logger.exception("Incoming TCPPacket is not a valid V2GTPMessage")
             raise exc
@@ -197,28 +224,40 @@ class SessionStateMachine(ABC):
             V2GMessageDINSPEC,
             None,
         ] = None
+        # The namespace only depends on the session's protocol and the payload
+        # type, so resolve it once here instead of in every branch below
+        exi_ns = self.get_exi_ns(v2gtp_msg.payload_type)
         try:
-            decoded_message = EXI().from_exi(
-                v2gtp_msg.payload, self.get_exi_ns(v2gtp_msg.payload_type)
+            # EXI decoding either blocks on I/O towards the codec (e.g. the
+            # Exificient codec is reached via a Java gateway socket) or burns
+            # CPU; running it in the default executor keeps the event loop
+            # free to serve the other communication sessions in the meantime
+            decoded_message = await asyncio.get_running_loop().run_in_executor(
+                None,
+                self._from_exi,
+                v2gtp_msg.payload,
+                exi_ns,
             )
 
-            if hasattr(self.comm_session, "evse_id"):
+            if logger.isEnabledFor(TRACE_LEVEL) and hasattr(
+                self.comm_session, "evse_id"
+            ):
                 logger.trace(  # type: ignore[attr-defined]
                     f"{self.comm_session.evse_id}:::"
                     f"{v2gtp_msg.payload.hex()}:::"
-                    f"{self.get_exi_ns(v2gtp_msg.payload_type).value}"
+                    f"{exi_ns.value}"
                 )
 
         except V2GMessageValidationError as exc:
             logger.error(
-                f"EXI message (ns={self.get_exi_ns(v2gtp_msg.payload_type)}) "
+                f"EXI message (ns={exi_ns}) "
                 f"where validation failed: {v2gtp_msg.payload.hex()}"
             )
             raise exc
         except EXIDecodingError as exc:
             logger.exception(f"{exc}")
             logger.error(
-                f"EXI message (ns={self.get_exi_ns(v2gtp_msg.payload_type)}) "
+                f"EXI message (ns={exi_ns}) "
                 f"where error occured: {v2gtp_msg.payload.hex()}"
             )
             raise exc
@@ -233,7 +272,7 @@ class SessionStateMachine(ABC):
 
         # Step 3
         try:
-            logger.info(f"{str(decoded_message)} received")
+            logger.info("%s received", decoded_message)
             await self.current_state.process_message(decoded_message, v2gtp_msg.payload)
         except MessageProcessingError as exc:
             logger.exception(
@@ -315,6 +354,16 @@ class V2GCommunicationSession(SessionStateMachine):
         # For timeout, termination, and pausing notifications
         self.session_handler_queue = session_handler_queue
         self.peer_name = self.writer.get_extra_info("peername")
+        # asyncio enables TCP_NODELAY on new transports since Python 3.6, but
+        # that is an implementation detail; set it explicitly so the small
+        # V2GTP requests/responses are never held back by Nagle's algorithm
+        sock = self.writer.get_extra_info("socket")
+        if sock is not None:
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError:
+                # Not a TCP socket (or already closed) - nothing to tune then
+                pass
         self.session_id: str = ""
         # Mutually agreed-upon ISO 15118 application protocol as result of SAP
         self.chosen_protocol: str = ""
@@ -343,6 +392,10 @@ class V2GCommunicationSession(SessionStateMachine):
         self.stop_reason: Optional[StopNotification] = None
         self.last_message_sent: Optional[V2GTPMessage] = None
         self._started: bool = True
+        # The background task finishing the delayed session teardown, see
+        # stop(). Also keeps a strong reference to the task, as asyncio
+        # itself only holds a weak one.
+        self._stop_task: Optional["asyncio.Task"] = None
 
         logger.info("Starting a new communication session")
         SessionStateMachine.__init__(self, start_state, comm_session)
@@ -373,11 +426,17 @@ class V2GCommunicationSession(SessionStateMachine):
             evse_controller = self.comm_session.evse_controller
             await evse_controller.set_present_protocol_state(state)
 
-    async def stop(self, reason: str):
+    async def stop(self, reason: Union[str, Callable[[], str]]):
         """
         Closes the TCP connection after 5 seconds and terminates or pauses the
         data link for this V2GCommunicationSession object after 2 seconds to
         make sure any message that needs to be sent can still go through.
+        The delayed part happens in a background task (see _finish_stop()),
+        so this coroutine returns immediately and the caller can enqueue its
+        StopNotification without waiting out the grace periods.
+        The reason can be given as a zero-argument callable returning the
+        reason string, which is then only evaluated when the string is
+        actually needed (for logging or for reporting the session end).
         TODO check if that really makes sense of if TCP should be terminated
              after 2 s and the data link after 5 s
 
@@ -395,16 +454,40 @@ class V2GCommunicationSession(SessionStateMachine):
         else:
             terminate_or_pause = SessionStopAction.TERMINATE
 
-        logger.info(
-            f"The data link will {terminate_or_pause} in 2 seconds and "
-            "the TCP connection will close in 5 seconds. "
+        if logger.isEnabledFor(logging.INFO):
+            if callable(reason):
+                reason = reason()
+            logger.info(
+                f"The data link will {terminate_or_pause} in 2 seconds and "
+                "the TCP connection will close in 5 seconds. "
+            )
+            logger.info(f"Reason: {reason}")
+
+        # The grace periods below add up to 5 seconds. Waiting them out here
+        # would keep rcv_loop (and with it all per-session state) alive for
+        # that long and delay the StopNotification the callers enqueue right
+        # after stop() returns, so the delayed part of the teardown runs in a
+        # background task instead.
+        self._stop_task = asyncio.create_task(
+            self._finish_stop(terminate_or_pause, reason)
         )
-        logger.info(f"Reason: {reason}")
 
+    async def _finish_stop(
+        self,
+        terminate_or_pause: SessionStopAction,
+        reason: Union[str, Callable[[], str]],
+    ):
+        """
+        The delayed part of stop(): terminates or pauses the data link after
+        2 seconds and closes the TCP connection after another 3 seconds, to
+        make sure any message that still needs to be sent can go through.
+        """
         await asyncio.sleep(2)
         # Signal data link layer to either terminate or pause the data
         # link connection
         if hasattr(self.comm_session, "evse_controller"):
+            if callable(reason):
+                reason = reason()
             evse_controller = self.comm_session.evse_controller
             await evse_controller.update_data_link(terminate_or_pause)
             await evse_controller.session_ended(str(self.current_state), reason)
@@ -428,10 +511,43 @@ class V2GCommunicationSession(SessionStateMachine):
         """
 
         # TODO: we may also check for writer exceptions
+        # write() just appends to the transport's send buffer. The V2GTP
+        # messages exchanged here are a few KB at most and each one is
+        # answered before the next is sent, so the buffer never approaches
+        # the transport's high-water mark and awaiting drain() after every
+        # write would only add an event loop round-trip per message.
         self.writer.write(message.to_bytes())
-        await self.writer.drain()
         self.last_message_sent = message
-        logger.info(f"Sent {str(self.current_state.message)}")
+        logger.info("Sent %s", self.current_state.message)
+
+    async def _rcv_v2gtp_msg(self) -> Tuple[bytes, bytes]:
+        """
+        Reads exactly one V2GTP message from the TCP socket, using the payload
+        length announced in the 8-byte V2GTP header to frame the read. This
+        way each message is read with an allocation of its actual size, and
+        messages glued together in one TCP segment are consumed one at a time.
+
+        Returns:
+            The V2GTP message as a (header, payload) tuple. The two parts are
+            kept separate so they don't have to be concatenated just to be
+            split up again by the V2GTP parser.
+
+        Raises:
+            asyncio.IncompleteReadError if the TCP peer closes the connection
+            before a complete message was received. 'partial' is empty if the
+            connection was closed cleanly between two messages.
+            InvalidV2GTPMessageError if the announced payload length exceeds
+            the supported maximum, so a garbled header can't make us buffer
+            gigabytes of data.
+        """
+        header = await self.reader.readexactly(8)
+        payload_length = int.from_bytes(header[4:8], "big")
+        if payload_length > _MAX_READ_SIZE:
+            raise InvalidV2GTPMessageError(
+                f"Payload length of {payload_length} bytes for V2GTP message "
+                f"exceeds the supported maximum of {_MAX_READ_SIZE} bytes"
+            )
+        return header, await self.reader.readexactly(payload_length)
 
     async def rcv_loop(self, timeout: float):
         """
@@ -450,42 +566,65 @@ class V2GCommunicationSession(SessionStateMachine):
         """
         while True:
             try:
-                # The biggest message is the Certificate Installation Response,
-                # which is estimated to be maximum between 5k to 6k
-                # TODO check if that still holds with -20 (e.g. cross certs)
-                message = await asyncio.wait_for(self.reader.read(7000), timeout)
-                if message == b"" and self.reader.at_eof():
-                    stop_reason: str = "TCP peer closed connection"
-                    await self.stop(reason=stop_reason)
-                    self.session_handler_queue.put_nowait(
-                        StopNotification(
-                            False,
-                            stop_reason,
-                            self.peer_name,
-                        )
+                if _asyncio_timeout is not None:
+                    async with _asyncio_timeout(timeout):
+                        header, payload = await self._rcv_v2gtp_msg()
+                else:
+                    header, payload = await asyncio.wait_for(
+                        self._rcv_v2gtp_msg(), timeout
                     )
-                    return
-            except (asyncio.TimeoutError, ConnectionResetError) as exc:
-                if type(exc) is asyncio.TimeoutError:
-                    if self.last_message_sent:
-                        error_msg = (
-                            f"{exc.__class__.__name__} occurred. Waited "
-                            f"for {timeout} s after sending last message: "
-                            f"{str(self.last_message_sent)}"
-                        )
-                    else:
-                        error_msg = (
-                            f"{exc.__class__.__name__} occurred. Waited "
+            except asyncio.IncompleteReadError as exc:
+                if exc.partial:
+                    stop_reason: str = (
+                        f"TCP peer closed connection in the middle of a V2GTP "
+                        f"message (received {len(exc.partial)} bytes)"
+                    )
+                else:
+                    stop_reason = "TCP peer closed connection"
+                await self.stop(reason=stop_reason)
+                self.session_handler_queue.put_nowait(
+                    StopNotification(
+                        False,
+                        stop_reason,
+                        self.peer_name,
+                    )
+                )
+                return
+            except (
+                asyncio.TimeoutError,
+                ConnectionResetError,
+                InvalidV2GTPMessageError,
+            ) as exc:
+                # Bind what the deferred formatting needs into locals, as the
+                # 'exc' name itself is cleared once the except block is left
+                exc_name = exc.__class__.__name__
+                exc_detail = str(exc)
+                timed_out = type(exc) is asyncio.TimeoutError
+                last_message_sent = self.last_message_sent
+
+                def error_msg() -> str:
+                    # Deferred into the StopNotification, as str() on the last
+                    # sent V2GTPMessage hex-dumps its whole payload
+                    if timed_out:
+                        if last_message_sent:
+                            return (
+                                f"{exc_name} occurred. Waited "
+                                f"for {timeout} s after sending last message: "
+                                f"{str(last_message_sent)}"
+                            )
+                        return (
+                            f"{exc_name} occurred. Waited "
                             f"for {timeout} s. No V2GTP message was "
                             "previously sent. This is probably a timeout "
                             f"while waiting for SupportedAppProtocolReq"
                         )
-                else:
-                    error_msg = f"{exc.__class__.__name__} occurred. {str(exc)}"
+                    return f"{exc_name} occurred. {exc_detail}"
 
                 self.stop_reason = StopNotification(False, error_msg, self.peer_name)
 
-                await self.stop(reason=error_msg)
+                # Route the reason through the notification's lazy property,
+                # so it is formatted at most once, no matter who reads it first
+                await self.stop(reason=lambda: self.stop_reason.reason)
                 self.session_handler_queue.put_nowait(self.stop_reason)
                 return
             gc_enabled = gc.isenabled()
@@ -494,32 +633,28 @@ class V2GCommunicationSession(SessionStateMachine):
                     gc.disable()
                 # This will create the values needed for the next state, such as
                 # next_state, next_v2gtp_message, next_message_payload_type etc.
-                await self.process_message(message)
-                if self.current_state.next_v2gtp_msg:
+                await self.process_message(header, payload)
+                current_state = self.current_state
+                if current_state.next_v2gtp_msg:
                     # next_v2gtp_msg would not be set only if the next state is either
                     # Terminate or Pause on the EVCC side
-                    await self.send(self.current_state.next_v2gtp_msg)
-                    await self._update_state_info(self.current_state)
+                    await self.send(current_state.next_v2gtp_msg)
+                    await self._update_state_info(current_state)
 
-                if self.current_state.next_state in (Terminate, Pause):
-                    await self.stop(reason=self.comm_session.stop_reason.reason)
+                next_state = current_state.next_state
+                if next_state is Terminate or next_state is Pause:
+                    await self.stop(reason=lambda: self.comm_session.stop_reason.reason)
                     self.comm_session.session_handler_queue.put_nowait(
                         self.comm_session.stop_reason
                     )
                     return
 
-                timeout = self.current_state.next_msg_timeout
+                timeout = current_state.next_msg_timeout
                 self.go_to_next_state()
-            except (
-                MessageProcessingError,
-                FaultyStateImplementationError,
-                EXIDecodingError,
-                InvalidV2GTPMessageError,
-                AttributeError,
-                ValueError,
-                ConnectionResetError,
-                Exception,
-            ) as exc:
+            except Exception as exc:
+                # Any error while processing a message ends the session. The
+                # typed exceptions (MessageProcessingError etc.) only differ in
+                # the detail they contribute to the stop reason below.
                 message_name = ""
                 additional_info = ""
                 if isinstance(exc, MessageProcessingError):
@@ -17,6 +17,11 @@ env.read_env(path=ENV_PATH)  # read .env file, if it exists
 LOG_LEVEL = env.str("LOG_LEVEL", default="INFO")
 env.seal()  # raise all errors at once, if any
 
+# The numeric value of the custom TRACE level registered in _init_logger().
+# Callers can use it with logger.isEnabledFor() to skip the (potentially
+# expensive) formatting of trace arguments altogether.
+TRACE_LEVEL = logging.DEBUG - 5
+
 
 def _init_logger():
     logging.config.fileConfig(fname=LOGGER_CONF_PATH, disable_existing_loggers=False)
@@ -26,7 +31,7 @@ def _init_logger():
     def trace(self, message, *args, **kwargs):
         pass
 
-    level_num = logging.DEBUG - 5
+    level_num = TRACE_LEVEL
     level_name = "TRACE"
     logging.addLevelName(level_num, level_name)
     setattr(logging, level_name, level_num)
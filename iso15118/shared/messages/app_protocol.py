@@ -23,6 +23,10 @@ class ResponseCodeSAP(str, Enum):
 
 
 class SupportedAppProtocolReq(BaseModel):
+    # The SAP request precedes the SessionSetupReq (and has no header), so the
+    # SECC must not check for a matching session ID
+    _skip_session_check = True
+
     app_protocol: List[AppProtocol] = Field(..., alias="AppProtocol")
 
     def __str__(self):
@@ -1,6 +1,6 @@
 import logging
 from abc import ABC
-from typing import Optional, Tuple, Type
+from typing import Dict, Optional, Tuple, Type
 
 from pydantic import Field, root_validator, validator
 
@@ -57,6 +57,10 @@ class BodyBase(BaseModel, ABC):
     See section 9.3.4 Message Body Definition in DIN SPEC 70121
     """
 
+    # Whether this message may arrive before a session ID has been agreed
+    # upon, in which case the SECC must not check the header's session ID
+    _skip_session_check = False
+
     def __str__(self):
         return type(self).__name__
 
@@ -72,6 +76,8 @@ class Response(BodyBase, ABC):
 class SessionSetupReq(BodyBase):
     """See section 9.4.1.2.2 in DIN SPEC 70121"""
 
+    _skip_session_check = True
+
     """Refer Table 29 under section 9.4.1.2.2"""
     # XSD type hexBinary with max 8 bytes
     # (Spec is quite unclear here, but data from field show that 8bytes are used)
@@ -528,29 +534,55 @@ class Body(BaseModel):
 
     def get_message_name(self) -> str:
         """Returns the name of the one V2GMessage that is set for Body."""
-        for k in self.__dict__.keys():
-            if getattr(self, k):
-                return str(getattr(self, k))
+        for msg in self.__dict__.values():
+            if msg:
+                return str(msg)
 
         return ""
 
     def get_message(self) -> Optional[BodyBase]:
-        """Returns the name of the one V2GMessage that is set for Body."""
-        for k in self.__dict__.keys():
-            if getattr(self, k):
-                return getattr(self, k)
+        """Returns the one V2GMessage that is set for Body."""
+        for msg in self.__dict__.values():
+            if msg:
+                return msg
 
         return None
 
     def get_message_and_name(self) -> Tuple[Optional[BodyBase], str]:
-        """Returns the name of the one V2GMessage that is set for Body."""
-        for k in self.__dict__.keys():
-            if getattr(self, k):
-                return getattr(self, k), str(getattr(self, k))
+        """Returns the one V2GMessage that is set for Body, and its name."""
+        for msg in self.__dict__.values():
+            if msg:
+                return msg, str(msg)
 
         return None, ""
 
 
+_msg_types: Dict[str, Type[BodyBase]] = {
+    "SessionSetupReq": SessionSetupReq,
+    "SessionSetupRes": SessionSetupRes,
+    "ServiceDiscoveryReq": ServiceDiscoveryReq,
+    "ServiceDiscoveryRes": ServiceDiscoveryRes,
+    "ServicePaymentSelectionReq": ServicePaymentSelectionReq,
+    "ServicePaymentSelectionRes": ServicePaymentSelectionRes,
+    "ContractAuthenticationReq": ContractAuthenticationReq,
+    "ContractAuthenticationRes": ContractAuthenticationRes,
+    "ChargeParameterDiscoveryReq": ChargeParameterDiscoveryReq,
+    "ChargeParameterDiscoveryRes": ChargeParameterDiscoveryRes,
+    "CableCheckReq": CableCheckReq,
+    "CableCheckRes": CableCheckRes,
+    "PreChargeReq": PreChargeReq,
+    "PreChargeRes": PreChargeRes,
+    "PowerDeliveryReq": PowerDeliveryReq,
+    "PowerDeliveryRes": PowerDeliveryRes,
+    "CurrentDemandReq": CurrentDemandReq,
+    "CurrentDemandRes": CurrentDemandRes,
+    "WeldingDetectionReq": WeldingDetectionReq,
+    "WeldingDetectionRes": WeldingDetectionRes,
+    "SessionStopReq": SessionStopReq,
+    "SessionStopRes": SessionStopRes,
+}
+
+
 def get_msg_type(msg_name: str) -> Optional[Type[BodyBase]]:
     """
     Returns the message type corresponding to the message name provided, or
@@ -561,29 +593,4 @@ def get_msg_type(msg_name: str) -> Optional[Type[BodyBase]]:
 
     Returns: The message type corresponding to the given message name
     """
-    msg_dict: dict[str, Type[BodyBase]] = {
-        "SessionSetupReq": SessionSetupReq,
-        "SessionSetupRes": SessionSetupRes,
-        "ServiceDiscoveryReq": ServiceDiscoveryReq,
-        "ServiceDiscoveryRes": ServiceDiscoveryRes,
-        "ServicePaymentSelectionReq": ServicePaymentSelectionReq,
-        "ServicePaymentSelectionRes": ServicePaymentSelectionRes,
-        "ContractAuthenticationReq": ContractAuthenticationReq,
-        "ContractAuthenticationRes": ContractAuthenticationRes,
-        "ChargeParameterDiscoveryReq": ChargeParameterDiscoveryReq,
-        "ChargeParameterDiscoveryRes": ChargeParameterDiscoveryRes,
-        "CableCheckReq": CableCheckReq,
-        "CableCheckRes": CableCheckRes,
-        "PreChargeReq": PreChargeReq,
-        "PreChargeRes": PreChargeRes,
-        "PowerDeliveryReq": PowerDeliveryReq,
-        "PowerDeliveryRes": PowerDeliveryRes,
-        "CurrentDemandReq": CurrentDemandReq,
-        "CurrentDemandRes": CurrentDemandRes,
-        "WeldingDetectionReq": WeldingDetectionReq,
-        "WeldingDetectionRes": WeldingDetectionRes,
-        "SessionStopReq": SessionStopReq,
-        "SessionStopRes": SessionStopRes,
-    }
-
-    return msg_dict.get(msg_name, None)
+    return _msg_types.get(msg_name, None)
@@ -267,6 +267,12 @@ class Protocol(Enum):
         """
         self.namespace = namespace
         self.payload_types = payload_types
+        # Computed once at enum creation, so per-message code doesn't need to
+        # scan the namespace URN to tell the ISO 15118-20 variants apart.
+        # Note that the namespace is already a str (via the str mixin of
+        # Namespace), so startswith() compares the URN value here; str() on a
+        # Namespace member would yield 'Namespace.<name>' instead.
+        self.is_iso_v20: bool = namespace.startswith(Namespace.ISO_V20_BASE)
 
     @property
     def ns(self) -> Namespace:
@@ -11,7 +11,7 @@ element names by using the 'alias' attribute.
 """
 import logging
 from abc import ABC
-from typing import Optional, Tuple, Type
+from typing import Dict, Optional, Tuple, Type
 
 from pydantic import Field, root_validator, validator
 
@@ -79,6 +79,10 @@ class BodyBase(BaseModel, ABC):
     See section 8.3.4 Message Body Definition in ISO 15118-2
     """
 
+    # Whether this message may arrive before a session ID has been agreed
+    # upon, in which case the SECC must not check the header's session ID
+    _skip_session_check = False
+
     def __str__(self):
         return type(self).__name__
 
@@ -578,6 +582,8 @@ class ServiceDiscoveryRes(Response):
 class SessionSetupReq(BodyBase):
     """See section 8.4.3.2.1 in ISO 15118-2"""
 
+    _skip_session_check = True
+
     # XSD type hexBinary with max 8 bytes encoded as 12 hexadecimal characters
     evcc_id: str = Field(..., max_length=12, alias="EVCCID")
 
@@ -701,29 +707,65 @@ class Body(BaseModel):
 
     def get_message_name(self) -> str:
         """Returns the name of the one V2GMessage that is set for Body."""
-        for k in self.__dict__.keys():
-            if getattr(self, k):
-                return str(getattr(self, k))
+        for msg in self.__dict__.values():
+            if msg:
+                return str(msg)
 
         return ""
 
     def get_message(self) -> Optional[BodyBase]:
-        """Returns the name of the one V2GMessage that is set for Body."""
-        for k in self.__dict__.keys():
-            if getattr(self, k):
-                return getattr(self, k)
+        """Returns the one V2GMessage that is set for Body."""
+        for msg in self.__dict__.values():
+            if msg:
+                return msg
 
         return None
 
     def get_message_and_name(self) -> Tuple[Optional[BodyBase], str]:
-        """Returns the name of the one V2GMessage that is set for Body."""
-        for k in self.__dict__.keys():
-            if getattr(self, k):
-                return getattr(self, k), str(getattr(self, k))
+        """Returns the one V2GMessage that is set for Body, and its name."""
+        for msg in self.__dict__.values():
+            if msg:
+                return msg, str(msg)
 
         return None, ""
 
 
+_msg_types: Dict[str, Type[BodyBase]] = {
+    "SessionSetupReq": SessionSetupReq,
+    "SessionSetupRes": SessionSetupRes,
+    "ServiceDiscoveryReq": ServiceDiscoveryReq,
+    "ServiceDiscoveryRes": ServiceDiscoveryRes,
+    "ServiceDetailReq": ServiceDetailReq,
+    "ServiceDetailRes": ServiceDetailRes,
+    "PaymentServiceSelectionReq": PaymentServiceSelectionReq,
+    "PaymentServiceSelectionRes": PaymentServiceSelectionRes,
+    "CertificateInstallationReq": CertificateInstallationReq,
+    "CertificateInstallationRes": CertificateInstallationRes,
+    "PaymentDetailsReq": PaymentDetailsReq,
+    "PaymentDetailsRes": PaymentDetailsRes,
+    "AuthorizationReq": AuthorizationReq,
+    "AuthorizationRes": AuthorizationRes,
+    "CableCheckReq": CableCheckReq,
+    "CableCheckRes": CableCheckRes,
+    "PreChargeReq": PreChargeReq,
+    "PreChargeRes": PreChargeRes,
+    "ChargeParameterDiscoveryReq": ChargeParameterDiscoveryReq,
+    "ChargeParameterDiscoveryRes": ChargeParameterDiscoveryRes,
+    "PowerDeliveryReq": PowerDeliveryReq,
+    "PowerDeliveryRes": PowerDeliveryRes,
+    "ChargingStatusReq": ChargingStatusReq,
+    "ChargingStatusRes": ChargingStatusRes,
+    "CurrentDemandReq": CurrentDemandReq,
+    "CurrentDemandRes": CurrentDemandRes,
+    "MeteringReceiptReq": MeteringReceiptReq,
+    "MeteringReceiptRes": MeteringReceiptRes,
+    "WeldingDetectionReq": WeldingDetectionReq,
+    "WeldingDetectionRes": WeldingDetectionRes,
+    "SessionStopReq": SessionStopReq,
+    "SessionStopRes": SessionStopRes,
+}
+
+
 def get_msg_type(msg_name: str) -> Optional[Type[BodyBase]]:
     """
     Returns the message type corresponding to the message name provided, or
@@ -734,39 +776,4 @@ def get_msg_type(msg_name: str) -> Optional[Type[BodyBase]]:
 
     Returns: The message type corresponding to the given message name
     """
-    msg_dict: dict[str, Type[BodyBase]] = {
-        "SessionSetupReq": SessionSetupReq,
-        "SessionSetupRes": SessionSetupRes,
-        "ServiceDiscoveryReq": ServiceDiscoveryReq,
-        "ServiceDiscoveryRes": ServiceDiscoveryRes,
-        "ServiceDetailReq": ServiceDetailReq,
-        "ServiceDetailRes": ServiceDetailRes,
-        "PaymentServiceSelectionReq": PaymentServiceSelectionReq,
-        "PaymentServiceSelectionRes": PaymentServiceSelectionRes,
-        "CertificateInstallationReq": CertificateInstallationReq,
-        "CertificateInstallationRes": CertificateInstallationRes,
-        "PaymentDetailsReq": PaymentDetailsReq,
-        "PaymentDetailsRes": PaymentDetailsRes,
-        "AuthorizationReq": AuthorizationReq,
-        "AuthorizationRes": AuthorizationRes,
-        "CableCheckReq": CableCheckReq,
-        "CableCheckRes": CableCheckRes,
-        "PreChargeReq": PreChargeReq,
-        "PreChargeRes": PreChargeRes,
-        "ChargeParameterDiscoveryReq": ChargeParameterDiscoveryReq,
-        "ChargeParameterDiscoveryRes": ChargeParameterDiscoveryRes,
-        "PowerDeliveryReq": PowerDeliveryReq,
-        "PowerDeliveryRes": PowerDeliveryRes,
-        "ChargingStatusReq": ChargingStatusReq,
-        "ChargingStatusRes": ChargingStatusRes,
-        "CurrentDemandReq": CurrentDemandReq,
-        "CurrentDemandRes": CurrentDemandRes,
-        "MeteringReceiptReq": MeteringReceiptReq,
-        "MeteringReceiptRes": MeteringReceiptRes,
-        "WeldingDetectionReq": WeldingDetectionReq,
-        "WeldingDetectionRes": WeldingDetectionRes,
-        "SessionStopReq": SessionStopReq,
-        "SessionStopRes": SessionStopRes,
-    }
-
-    return msg_dict.get(msg_name, None)
+    return _msg_types.get(msg_name, None)
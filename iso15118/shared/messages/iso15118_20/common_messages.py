@@ -105,6 +105,8 @@ class ContractCertificateChain(BaseModel):
 class SessionSetupReq(V2GRequest):
     """See section 8.3.4.3.1.1 in ISO 15118-20"""
 
+    _skip_session_check = True
+
     evcc_id: str = Field(..., max_length=255, alias="EVCCID")
 
 
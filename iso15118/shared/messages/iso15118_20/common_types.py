@@ -81,6 +81,10 @@ class V2GMessage(BaseModel, ABC):
     structure, where the header is not included within each Request and Response message
     """
 
+    # Whether this message may arrive before a session ID has been agreed
+    # upon, in which case the SECC must not check the header's session ID
+    _skip_session_check = False
+
     header: MessageHeader = Field(..., alias="Header")
 
     def __str__(self):
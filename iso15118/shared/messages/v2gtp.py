@@ -1,4 +1,5 @@
 import logging
+import struct
 from typing import Union
 
 from iso15118.shared.exceptions import (
@@ -17,6 +18,12 @@ from iso15118.shared.messages.enums import (
 
 logger = logging.getLogger(__name__)
 
+# Built once at import time, so the per-message validity checks don't have to
+# construct fresh option lists for every parsed frame
+_PROTOCOLS = frozenset(Protocol)
+_ISOV2_PAYLOAD_TYPES = frozenset(ISOV2PayloadTypes)
+_ISOV20_PAYLOAD_TYPES = frozenset(ISOV20PayloadTypes)
+
 
 class V2GTPMessage:
     def __init__(
@@ -51,7 +58,7 @@ class V2GTPMessage:
         payload_type: Contains info of how to decode the payload
         payload_length: Contains the length of the V2GTP message in bytes
         """
-        if protocol not in Protocol.options():
+        if protocol not in _PROTOCOLS:
             raise InvalidProtocolError(
                 f"'{protocol.name}' is not a "
                 "valid protocol. Allowed: "
@@ -90,12 +97,9 @@ class V2GTPMessage:
     @classmethod
     def is_payload_type_valid(cls, protocol: Protocol, payload_type: int) -> bool:
         if (
-            protocol in [Protocol.ISO_15118_2, Protocol.UNKNOWN]
-            and payload_type not in ISOV2PayloadTypes.options()
-        ) or (
-            protocol.ns.startswith("urn:iso:std:iso:15118:-20")
-            and payload_type not in ISOV20PayloadTypes.options()
-        ):
+            protocol in (Protocol.ISO_15118_2, Protocol.UNKNOWN)
+            and payload_type not in _ISOV2_PAYLOAD_TYPES
+        ) or (protocol.is_iso_v20 and payload_type not in _ISOV20_PAYLOAD_TYPES):
             logger.error(
                 f"{str(protocol)} does not support payload type " f"{payload_type}"
             )
@@ -117,7 +121,7 @@ class V2GTPMessage:
             )
             is_valid = False
 
-        if protocol not in Protocol.options():
+        if protocol not in _PROTOCOLS:
             logger.error(
                 f"Unable to identify protocol version. " f"Received: {protocol}"
             )
@@ -161,28 +165,67 @@ class V2GTPMessage:
         return is_valid
 
     def to_bytes(self) -> bytes:
-        header = (
-            self.protocol_version.to_bytes(1, "big")
-            + self.inv_protocol_version.to_bytes(1, "big")
-            + self.payload_type.to_bytes(2, "big")
-            + self.payload_length.to_bytes(4, "big")
+        # Packing the whole header at once keeps this to a single struct call
+        # and one concatenation, instead of one allocation per header field
+        return (
+            struct.pack(
+                "!BBHI",
+                self.protocol_version,
+                self.inv_protocol_version,
+                self.payload_type,
+                self.payload_length,
+            )
+            + self.payload
         )
 
-        return bytes(header) + self.payload
+    @classmethod
+    def from_parts(
+        cls, protocol: Protocol, header: bytes, payload: bytes
+    ) -> "V2GTPMessage":
+        """
+        Creates a V2G Transfer Protocol (V2GTP) message from an already
+        separated header and payload, as delivered by a framed read from the
+        TCP socket. Keeping the two parts separate avoids concatenating them
+        into one bytes object just to split them up again here.
+
+        Args:
+            protocol: Either DIN SPEC 70121, ISO 15118-2 or ISO 15118-20
+            header: The 8-byte V2GTP header
+            payload: The V2GTP payload
+
+        Returns: A V2GTPMessage instance, if the header turns out to be a
+                 valid V2GTP header
+
+        Raises:
+            InvalidV2GTPMessageError
+        """
+        payload_type: Union[ISOV2PayloadTypes, ISOV20PayloadTypes]
+        if cls.is_header_valid(protocol, header):
+            raw_payload_type = cls.get_payload_type(header)
+            if protocol.is_iso_v20:
+                payload_type = ISOV20PayloadTypes(raw_payload_type)
+            else:
+                payload_type = ISOV2PayloadTypes(raw_payload_type)
+            return V2GTPMessage(protocol, payload_type, payload)
+        raise InvalidV2GTPMessageError(
+            "Not a valid V2GTP message " "(header check failed)"
+        )
 
     @classmethod
     def from_bytes(cls, protocol: Protocol, data: bytes) -> "V2GTPMessage":
         """
         Creates a V2G Transfer Protocol (V2GTP) message from the given
-        bytearray, either received by the
-        UDP client/server or TCP client/server
+        bytes-like object (bytes, bytearray, or memoryview), either received
+        by the UDP client/server or TCP client/server. Callers holding a
+        larger receive buffer can pass a memoryview slice to avoid copying
+        the data up front; only the payload is copied out.
 
         Args:
             protocol: Either DIN SPEC 70121, ISO 15118-2 or ISO 15118-20
-            data: The bytearray received by the UDP client/server or
+            data: The bytes-like object received by the UDP client/server or
                   TCP client/server
 
-        Returns: A V2GTPMessage instance, if the bytearray turns out to be a
+        Returns: A V2GTPMessage instance, if the data turns out to be a
                  valid V2GTPMessage
 
         Raises:
@@ -191,18 +234,7 @@ class V2GTPMessage:
         # The smallest possible datagram is a V2GTP message with an
         # SDP request of 2 bytes
         if len(data) >= 10:
-            header = data[:8]
-
-            payload_type: Union[ISOV2PayloadTypes, ISOV20PayloadTypes]
-            if cls.is_header_valid(protocol, header):
-                if protocol.ns.startswith("urn:iso:std:iso:15118:-20"):
-                    payload_type = ISOV20PayloadTypes(cls.get_payload_type(header))
-                else:
-                    payload_type = ISOV2PayloadTypes(cls.get_payload_type(header))
-                return V2GTPMessage(protocol, payload_type, data[8:])
-            raise InvalidV2GTPMessageError(
-                "Not a valid V2GTP message " "(header check failed)"
-            )
+            return cls.from_parts(protocol, bytes(data[:8]), bytes(data[8:]))
         raise InvalidV2GTPMessageError(
             f"Incoming data is too short to be "
             "a valid V2GTP message"
@@ -1,5 +1,5 @@
 from asyncio.streams import StreamReader, StreamWriter
-from typing import Tuple
+from typing import Callable, Tuple, Union
 
 from iso15118.shared.messages.enums import SessionStopAction
 
@@ -56,7 +56,10 @@ class StopNotification(Notification):
                     to an error in the communication (False). The latter might cause
                     a communication session retry.
         reason: Additional information as to why the communication session is stopped.
-                Helpful for further debugging.
+                Helpful for further debugging. Can also be given as a callable
+                that takes no arguments and returns the reason string, in which
+                case the string is only built once somebody actually reads the
+                'reason' attribute (e.g. for logging it).
         peer_ip_address: The IPv6 address of the peer. Relevant only for the SECC
                          to manage the various communication sessions the TCP
                          server is serving.
@@ -65,11 +68,24 @@ class StopNotification(Notification):
     def __init__(
         self,
         successful: bool,
-        reason: str,
+        reason: Union[str, Callable[[], str]],
         peer_ip_address: str = None,
         stop_action: SessionStopAction = SessionStopAction.TERMINATE,
     ):
         self.successful = successful
-        self.reason = reason
+        self._reason = reason
         self.peer_ip_address = peer_ip_address
         self.stop_action = stop_action
+
+    @property
+    def reason(self) -> str:
+        # A callable is evaluated on first access and its result kept, so
+        # consumers that only route on 'successful' never pay for formatting
+        # the reason string
+        if callable(self._reason):
+            self._reason = self._reason()
+        return self._reason
+
+    @reason.setter
+    def reason(self, reason: Union[str, Callable[[], str]]):
+        self._reason = reason
@@ -440,7 +440,7 @@ def load_cert_chain(
             certificate=leaf_cert, sub_certificates=sub_ca_certs_v2
         )
 
-    if protocol.ns.startswith(Namespace.ISO_V20_BASE):
+    if protocol.is_iso_v20:
         sub_ca_certs_v20: SubCertificatesV20 = SubCertificatesV20(
             certificates=[sub_ca2_cert]
         )
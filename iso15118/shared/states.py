@@ -1,7 +1,7 @@
 import base64
 import logging
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Optional, Type, Union
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Type, Union
 
 from pydantic import ValidationError
 
@@ -11,7 +11,9 @@ from iso15118.shared.exceptions import (
     InvalidProtocolError,
 )
 from iso15118.shared.exi_codec import EXI
+from iso15118.shared.logging import TRACE_LEVEL
 from iso15118.shared.messages.app_protocol import (
+    ResponseCodeSAP,
     SupportedAppProtocolReq,
     SupportedAppProtocolRes,
 )
@@ -43,6 +45,13 @@ from iso15118.shared.messages.xmldsig import Signature
 
 logger = logging.getLogger(__name__)
 
+# EXI-encoded SupportedAppProtocolRes payloads, keyed by (response code,
+# schema ID). The SAP response is the only message without any session-
+# specific content (no session ID, timestamp, or signature), so its encoding
+# is identical for every charging session and can be reused instead of
+# running the EXI codec again on each plug-in.
+_sap_res_exi_cache: Dict[Tuple[ResponseCodeSAP, Optional[int]], bytes] = {}
+
 if TYPE_CHECKING:
     # EVCCCommunicationSession and SECCCommunicationSession are used for
     # annotation purposes only, as a type hint for the comm_session class
@@ -85,6 +94,20 @@ class State(ABC):
 
     # pylint: disable=too-many-instance-attributes
 
+    # States are short-lived objects created on every state transition, so
+    # they store their fixed set of attributes in slots instead of a
+    # per-instance dict. Subclasses that don't declare __slots__ themselves
+    # still get a __dict__ and may add further attributes as before.
+    __slots__ = (
+        "comm_session",
+        "timeout",
+        "next_state",
+        "next_msg_signature",
+        "message",
+        "next_v2gtp_msg",
+        "next_msg_timeout",
+    )
+
     def __init__(
         self,
         comm_session: Union["EVCCCommunicationSession", "SECCCommunicationSession"],
@@ -136,7 +159,7 @@ class State(ABC):
         # result of sending this next message
         self.next_msg_timeout: Union[float, int] = 0
 
-        logger.info(f"Entered state {str(self)}")
+        logger.info("Entered state %s", self)
 
         if timeout > 0:
             self.timeout = timeout
@@ -338,10 +361,23 @@ class State(ABC):
         # Otherwise, EXI encode the message.
         if to_be_exi_encoded and next_msg_payload_type:
             # Step 3
+            cache_key: Optional[Tuple[ResponseCodeSAP, Optional[int]]] = None
+            if isinstance(to_be_exi_encoded, SupportedAppProtocolRes):
+                cache_key = (
+                    to_be_exi_encoded.response_code,
+                    to_be_exi_encoded.schema_id,
+                )
             try:
-                exi_payload = EXI().to_exi(to_be_exi_encoded, namespace)
+                if cache_key is not None and cache_key in _sap_res_exi_cache:
+                    exi_payload = _sap_res_exi_cache[cache_key]
+                else:
+                    exi_payload = EXI().to_exi(to_be_exi_encoded, namespace)
+                    if cache_key is not None:
+                        _sap_res_exi_cache[cache_key] = exi_payload
 
-                if hasattr(self.comm_session, "evse_id"):
+                if logger.isEnabledFor(TRACE_LEVEL) and hasattr(
+                    self.comm_session, "evse_id"
+                ):
                     logger.trace(  # type: ignore[attr-defined]
                         f"{self.comm_session.evse_id}:::"
                         f"{exi_payload.hex()}:::"
@@ -380,6 +416,8 @@ class State(ABC):
 
 
 class Terminate(State):
+    __slots__ = ()
+
     def __init__(
         self,
         comm_session: Union["EVCCCommunicationSession", "SECCCommunicationSession"],
@@ -402,6 +440,8 @@ class Terminate(State):
 
 
 class Pause(State):
+    __slots__ = ()
+
     def __init__(
         self,
         comm_session: Union["EVCCCommunicationSession", "SECCCommunicationSession"],
@@ -20,6 +20,7 @@ from tests.tools import MOCK_SESSION_ID
 def comm_evcc_session_mock():
     comm_session_mock = Mock(spec=EVCCCommunicationSession)
     comm_session_mock.session_id = MOCK_SESSION_ID
+    comm_session_mock.peer_name = "fake-peer"
     comm_session_mock.stop_reason = StopNotification(False, "pytest")
     comm_session_mock.ev_controller = SimEVController(EVCCConfig())
     comm_session_mock.protocol = Protocol.UNKNOWN
@@ -43,4 +44,5 @@ def comm_secc_session_mock():
     comm_session_mock.evse_id = "UK123E1234"
     comm_session_mock.ev_session_context = EVSessionContext15118()
     comm_session_mock.selected_schedule = 1
+    comm_session_mock.peer_name = "fake-peer"
     return comm_session_mock
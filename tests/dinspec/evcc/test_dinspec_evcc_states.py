@@ -51,6 +51,7 @@ class TestEvScenarios:
     def _comm_session(self, comm_evcc_session_mock):
         self.comm_session_mock = Mock(spec=EVCCCommunicationSession)
         self.comm_session_mock.session_id = "F9F9EE8505F55838"
+        self.comm_session_mock.peer_name = "fake-peer"
         self.comm_session_mock.stop_reason = StopNotification(False, "pytest")
         evcc_config = EVCCConfig()
         evcc_config.energy_transfer_mode = EnergyTransferModeEnum.DC_EXTENDED
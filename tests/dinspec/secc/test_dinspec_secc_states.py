@@ -28,6 +28,7 @@ class TestEvseScenarios:
     @pytest.fixture(autouse=True)
     def _comm_session(self):
         self.comm_session = Mock(spec=SECCCommunicationSession)
+        self.comm_session.peer_name = "fake-peer"
         self.comm_session.session_id = "F9F9EE8505F55838"
         # comm_session.offered_schedules = get_sa_schedule_list()
         self.comm_session.selected_energy_mode = EnergyTransferModeEnum.DC_EXTENDED
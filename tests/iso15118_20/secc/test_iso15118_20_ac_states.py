@@ -85,6 +85,7 @@ class TestEvScenarios:
     @pytest.fixture(autouse=True)
     def _comm_session(self):
         self.comm_session = Mock(spec=SECCCommunicationSession)
+        self.comm_session.peer_name = "fake-peer"
         self.comm_session.session_id = "F9F9EE8505F55838"
         self.comm_session.selected_energy_mode = (
             EnergyTransferModeEnum.AC_THREE_PHASE_CORE
@@ -0,0 +1,56 @@
+import pytest
+
+from iso15118.shared.exceptions import InvalidV2GTPMessageError
+from iso15118.shared.messages.enums import (
+    ISOV2PayloadTypes,
+    ISOV20PayloadTypes,
+    Protocol,
+)
+from iso15118.shared.messages.v2gtp import V2GTPMessage
+
+
+class TestV2GTPMessage:
+    def test_iso_v20_protocols_are_flagged_as_such(self):
+        assert not Protocol.UNKNOWN.is_iso_v20
+        assert not Protocol.DIN_SPEC_70121.is_iso_v20
+        assert not Protocol.ISO_15118_2.is_iso_v20
+        assert Protocol.ISO_15118_20_COMMON_MESSAGES.is_iso_v20
+        assert Protocol.ISO_15118_20_AC.is_iso_v20
+        assert Protocol.ISO_15118_20_DC.is_iso_v20
+        assert Protocol.ISO_15118_20_WPT.is_iso_v20
+        assert Protocol.ISO_15118_20_ACDP.is_iso_v20
+
+    def test_iso_v2_frame_roundtrip(self):
+        message = V2GTPMessage(
+            Protocol.ISO_15118_2, ISOV2PayloadTypes.EXI_ENCODED, b"exi payload"
+        )
+        parsed = V2GTPMessage.from_bytes(Protocol.ISO_15118_2, message.to_bytes())
+        assert parsed.payload_type == ISOV2PayloadTypes.EXI_ENCODED
+        assert parsed.payload == b"exi payload"
+
+    def test_iso_v20_frame_roundtrip(self):
+        # Regression test: the payload type of an ISO 15118-20 frame must be
+        # parsed as an ISOV20PayloadTypes entry. With the -20 branch broken,
+        # parsing a MAINSTREAM frame raised an uncaught ValueError, ending
+        # every -20 session right after SAP.
+        message = V2GTPMessage(
+            Protocol.ISO_15118_20_AC, ISOV20PayloadTypes.MAINSTREAM, b"exi payload"
+        )
+        raw = message.to_bytes()
+        parsed = V2GTPMessage.from_parts(Protocol.ISO_15118_20_AC, raw[:8], raw[8:])
+        assert parsed.payload_type == ISOV20PayloadTypes.MAINSTREAM
+        assert parsed.payload == b"exi payload"
+
+        parsed = V2GTPMessage.from_bytes(Protocol.ISO_15118_20_AC, raw)
+        assert parsed.payload_type == ISOV20PayloadTypes.MAINSTREAM
+
+    def test_iso_v20_frame_with_invalid_payload_type_is_rejected(self):
+        message = V2GTPMessage(
+            Protocol.ISO_15118_20_AC, ISOV20PayloadTypes.MAINSTREAM, b"exi payload"
+        )
+        raw = bytearray(message.to_bytes())
+        # Overwrite the payload type field with a value no protocol defines
+        raw[2:4] = (0x1234).to_bytes(2, "big")
+        assert not V2GTPMessage.is_payload_type_valid(Protocol.ISO_15118_20_AC, 0x1234)
+        with pytest.raises(InvalidV2GTPMessageError):
+            V2GTPMessage.from_bytes(Protocol.ISO_15118_20_AC, bytes(raw))